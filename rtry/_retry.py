@@ -1,15 +1,18 @@
 import asyncio
 import time
-from functools import wraps
-from typing import Any, Callable, List, Optional, Union, cast
+from functools import partial, wraps
+from itertools import count
+from typing import Any, Callable, List, Optional, Tuple, Union, cast
 
 from ._errors import CancelledError
 from ._timeout import Timeout
 from ._types import (
     AnyCallable,
+    AsyncDelayCallable,
     AttemptValue,
     DelayCallable,
     DelayValue,
+    ExceptionType,
     LoggerCallable,
     SwallowException,
     TimeoutValue,
@@ -19,110 +22,156 @@ from ._types import (
 __all__ = ("Retry",)
 
 
+def _backoff_delay(base: DelayValue, cap: DelayValue, attempt: AttemptValue) -> DelayValue:
+    try:
+        return min(base * 2.0 ** (attempt - 1), cap)
+    except OverflowError:
+        return cap
+
+
 class Retry:
+    __slots__ = ("_timeout_factory", "_until", "_attempts", "_timeout", "_delay", "_backoff",
+                 "_swallow", "_swallow_types", "_logger", "_logger_callable", "_delay_callable",
+                 "_delay_awaitable",)
+
     def __init__(self, timeout_factory: Callable[[TimeoutValue], Timeout], *,
                  until: Optional[UntilCallable] = None,
                  attempts: Optional[AttemptValue] = None,
                  timeout: Optional[TimeoutValue] = None,
-                 delay: Optional[Union[DelayValue, DelayCallable]] = None,
+                 delay: Optional[Union[DelayValue, DelayCallable, AsyncDelayCallable]] = None,
                  swallow: Optional[SwallowException] = BaseException,
-                 logger: Optional[LoggerCallable] = None) -> None:
+                 logger: Optional[LoggerCallable] = None,
+                 backoff: Optional[Tuple[DelayValue, DelayValue]] = None) -> None:
         assert (attempts is not None) or (timeout is not None)
         if attempts is not None:
             assert attempts > 0
         if timeout is not None:
             assert timeout >= 0
+        if backoff is not None:
+            assert delay is None
+            assert 0 <= backoff[0] <= backoff[1]
 
         self._timeout_factory = timeout_factory
         self._until = until
         self._attempts = attempts
         self._timeout = timeout
         self._delay = delay
+        self._backoff = backoff
         self._swallow = () if swallow is None else swallow
         if isinstance(self._swallow, list):
             self._swallow = tuple(self._swallow)
+        self._swallow_types: Tuple[ExceptionType, ...] = (
+            self._swallow if isinstance(self._swallow, tuple) else (self._swallow,))
         self._logger = logger
-        self._fn: Union[AnyCallable, None] = None
-
-    def _sync_wrapped(self, *args: Any, **kwargs: Any) -> Any:
-        assert self._fn is not None
-
-        retried = 0
-        exception = None
-        while (self._attempts is None) or (retried < self._attempts):
-            try:
-                result = self._fn(*args, **kwargs)
-            except CancelledError:
-                raise
-            except self._swallow as e:
-                exception = e
-            else:
-                if self._until is None:
-                    return result
-                elif not self._until(result):
-                    return result
-                exception = None
-            retried += 1
-            if self._logger and hasattr(self._logger, "__call__"):
-                self._logger(retried, exception or result, self._fn)
-            if self._delay is not None:
-                delay = self._delay
-                if hasattr(self._delay, "__call__"):
-                    delay = self._delay(retried)
-                time.sleep(cast(float, delay))
-            else:
-                time.sleep(0.0)
-        if exception:
-            raise exception
-        return result
-
-    async def _async_wrapped(self, *args: Any, **kwargs: Any) -> Any:
-        assert self._fn is not None
-
-        retried = 0
-        exception = None
-        while (self._attempts is None) or (retried < self._attempts):
-            try:
-                result = await self._fn(*args, **kwargs)
-            except (CancelledError, asyncio.CancelledError):
-                raise
-            except self._swallow as e:
-                exception = e
-            else:
-                if self._until is None:
-                    return result
-                elif not self._until(result):
-                    return result
-                exception = None
-            retried += 1
-            if self._logger and hasattr(self._logger, "__call__"):
-                self._logger(retried, exception or result, self._fn)
-            if self._delay is not None:
-                delay = self._delay
-                if hasattr(self._delay, "__call__"):
-                    delay = self._delay(retried)
-                await asyncio.sleep(cast(float, delay))
-            else:
-                await asyncio.sleep(0.0)
-        if exception:
-            raise exception
-        return result
+        self._logger_callable = callable(logger)
+        self._delay_callable = callable(delay)
+        self._delay_awaitable = asyncio.iscoroutinefunction(delay)
 
-    def __call__(self, fn: AnyCallable) -> AnyCallable:
-        self._fn = fn
+    def _make_sync_wrapped(self, fn: AnyCallable) -> AnyCallable:
+        until = self._until
+        attempts = self._attempts
+        swallow = self._swallow_types
+        logger = cast(LoggerCallable, self._logger) if self._logger_callable else None
+        delay = cast(DelayValue, self._delay) if not self._delay_callable else None
+        if not delay:
+            delay = None
+        delay_fn = cast(DelayCallable, self._delay) if self._delay_callable else None
+        if self._backoff is not None:
+            delay_fn = partial(_backoff_delay, *self._backoff)
+
+        single = (attempts == 1) and (until is None) and (logger is None)
+        if single and (delay is None) and (delay_fn is None):
+            def sync_once(*args: Any, **kwargs: Any) -> Any:
+                return fn(*args, **kwargs)
+            return sync_once
 
+        def sync_wrapped(*args: Any, **kwargs: Any) -> Any:
+            exception = None
+            for retried in (count(1) if attempts is None else range(1, attempts + 1)):
+                try:
+                    result = fn(*args, **kwargs)
+                except CancelledError:
+                    raise
+                except swallow as e:
+                    exception = e
+                else:
+                    if until is None:
+                        return result
+                    elif not until(result):
+                        return result
+                    exception = None
+                if logger is not None:
+                    logger(retried, exception or result, fn)
+                if delay_fn is not None:
+                    time.sleep(delay_fn(retried))
+                elif delay is not None:
+                    time.sleep(delay)
+            if exception:
+                raise exception
+            return result
+        return sync_wrapped
+
+    def _make_async_wrapped(self, fn: AnyCallable) -> AnyCallable:
+        until = self._until
+        attempts = self._attempts
+        swallow = self._swallow_types
+        logger = cast(LoggerCallable, self._logger) if self._logger_callable else None
+        delay = cast(DelayValue, self._delay) if not self._delay_callable else None
+        delay_fn = None
+        async_delay_fn = None
+        if self._delay_awaitable:
+            async_delay_fn = cast(AsyncDelayCallable, self._delay)
+        elif self._delay_callable:
+            delay_fn = cast(DelayCallable, self._delay)
+        if self._backoff is not None:
+            delay_fn = partial(_backoff_delay, *self._backoff)
+        yield_to_loop = (self._delay is None) and bool(self._timeout)
+
+        single = (attempts == 1) and (until is None) and (logger is None)
+        if single and (delay is None) and (delay_fn is None) and (async_delay_fn is None):
+            async def async_once(*args: Any, **kwargs: Any) -> Any:
+                return await fn(*args, **kwargs)
+            return async_once
+
+        async def async_wrapped(*args: Any, **kwargs: Any) -> Any:
+            exception = None
+            for retried in (count(1) if attempts is None else range(1, attempts + 1)):
+                try:
+                    result = await fn(*args, **kwargs)
+                except (CancelledError, asyncio.CancelledError):
+                    raise
+                except swallow as e:
+                    exception = e
+                else:
+                    if until is None:
+                        return result
+                    elif not until(result):
+                        return result
+                    exception = None
+                if logger is not None:
+                    logger(retried, exception or result, fn)
+                if async_delay_fn is not None:
+                    await asyncio.sleep(await async_delay_fn(retried))
+                elif delay_fn is not None:
+                    await asyncio.sleep(delay_fn(retried))
+                elif delay is not None:
+                    await asyncio.sleep(delay)
+                elif yield_to_loop:
+                    await asyncio.sleep(0.0)
+            if exception:
+                raise exception
+            return result
+        return async_wrapped
+
+    def __call__(self, fn: AnyCallable) -> AnyCallable:
         if asyncio.iscoroutinefunction(fn):
-            @wraps(fn)
-            async def async_wrapped(*args: Any, **kwargs: Any) -> Any:
-                return await self._async_wrapped(*args, **kwargs)
-            wrapped = async_wrapped
+            wrapped = self._make_async_wrapped(fn)
         else:
-            @wraps(fn)
-            def sync_wrapped(*args: Any, **kwargs: Any) -> Any:
-                return self._sync_wrapped(*args, **kwargs)
-            wrapped = sync_wrapped
+            assert not self._delay_awaitable
+            wrapped = self._make_sync_wrapped(fn)
+        wrapped = wraps(fn)(wrapped)
 
-        if self._timeout is None:
+        if not self._timeout:
             return wrapped
         return self._timeout_factory(self._timeout)(wrapped)
 
@@ -136,6 +185,8 @@ class Retry:
             args += ["timeout={}".format(self._timeout)]
         if self._delay is not None:
             args += ["delay={}".format(repr(self._delay))]
+        if self._backoff is not None:
+            args += ["backoff={}".format(self._backoff)]
         if (self._swallow is not None) and (self._swallow != BaseException):
             args += ["swallow={}".format(self._swallow)]
         if self._logger is not None:
@@ -1,12 +1,12 @@
 import asyncio
-import sched
+import heapq
 import signal
 import sys
 from abc import ABC, abstractmethod
 from sched import Event
 from time import monotonic, sleep
 from types import FrameType
-from typing import Any, Callable, Union
+from typing import Any, Callable, Generic, List, TypeVar, Union
 
 from ._types import DelayValue, SignalHandler, TimeoutValue
 
@@ -18,22 +18,31 @@ except AttributeError:
 __all__ = ("AbstractScheduler", "Scheduler", "AsyncScheduler",
            "Event", "AsyncEvent",)
 
+EventType = TypeVar("EventType")
 
-class AbstractScheduler(ABC):
+if sys.version_info >= (3, 10):
+    def _make_event(time: TimeoutValue, priority: int, action: Callable[[], None]) -> Event:
+        return Event(time, priority, 0, action, (), {})
+else:
+    def _make_event(time: TimeoutValue, priority: int, action: Callable[[], None]) -> Event:
+        return Event(time, priority, action, (), {})
+
+
+class AbstractScheduler(ABC, Generic[EventType]):
     @abstractmethod
-    def get_remaining(self, event: Event) -> TimeoutValue:
+    def get_remaining(self, event: EventType) -> TimeoutValue:
         pass
 
     @abstractmethod
-    def new(self, seconds: TimeoutValue, handler: Callable[[], None]) -> Event:
+    def new(self, seconds: TimeoutValue, handler: Callable[[], None]) -> EventType:
         pass
 
     @abstractmethod
-    def cancel(self, event: Union[Event, None]) -> None:
+    def cancel(self, event: Union[EventType, None]) -> None:
         pass
 
 
-class Scheduler(AbstractScheduler):
+class Scheduler(AbstractScheduler[Event]):
     def __init__(self,
                  timefunc: Callable[[], TimeoutValue] = monotonic,
                  delayfunc: Callable[[DelayValue], Any] = sleep,
@@ -41,73 +50,77 @@ class Scheduler(AbstractScheduler):
         self._timefunc = timefunc
         self._delayfunc = delayfunc
         self._itimer = itimer
-        self._scheduler = sched.scheduler(timefunc, delayfunc)
+        self._queue: List[Event] = []
         self._orig_handler: Union[SignalHandler, None] = None
+        self._armed: Union[Event, None] = None
+        self._priority = 0
 
     def get_remaining(self, event: Event) -> TimeoutValue:
         return max(0, event.time - self._timefunc())
 
-    def _next_event(self) -> TimeoutValue:
-        return self.get_remaining(self._scheduler.queue[0]) if self._scheduler.queue else 0
+    def _arm(self, now: Union[TimeoutValue, None] = None) -> None:
+        queue = self._queue
+        if queue and (queue[0] is not self._armed):
+            self._armed = queue[0]
+            if now is None:
+                now = self._timefunc()
+            signal.setitimer(self._itimer, max(0, self._armed.time - now))
 
     def new(self, seconds: TimeoutValue, handler: Callable[[], None]) -> Event:
         orig_handler = signal.getsignal(signal.SIGALRM)
-        if not isinstance(orig_handler, type(self)):
-            self._orig_handler = orig_handler
-
-        priority = -len(self._scheduler.queue)
-        event = self._scheduler.enter(seconds, priority, handler)
+        if orig_handler is not self:
+            if not isinstance(orig_handler, type(self)):
+                self._orig_handler = orig_handler
+            signal.signal(signal.SIGALRM, self)  # type: ignore
 
-        signal.signal(signal.SIGALRM, self)  # type: ignore
-        signal.setitimer(self._itimer, self._next_event())
+        now = self._timefunc()
+        self._priority -= 1
+        event = _make_event(now + seconds, self._priority, handler)
+        heapq.heappush(self._queue, event)
+        self._arm(now)
 
         return event
 
     def cancel(self, event: Union[Event, None]) -> None:
+        if event is None:
+            return
+
         try:
-            self._scheduler.cancel(event)  # type: ignore
+            self._queue.remove(event)
         except ValueError:
             pass
+        else:
+            heapq.heapify(self._queue)
 
-        if self._scheduler.empty():
+        if not self._queue:
             signal.alarm(0)
+            self._armed = None
             if self._orig_handler:
                 signal.signal(signal.SIGALRM, self._orig_handler)
                 self._orig_handler = None
         else:
-            signal.setitimer(self._itimer, self._next_event())
+            self._arm()
 
     def __call__(self, signum: int, frame: FrameType) -> None:
-        self._scheduler.run(blocking=False)
+        self._armed = None
+        now = self._timefunc()
+        while self._queue and (self._queue[0].time <= now):
+            event = heapq.heappop(self._queue)
+            event.action(*event.argument, **event.kwargs)
+        self._arm()
 
 
 class AsyncEvent(Event):
     pass
 
 
-class AsyncScheduler(AbstractScheduler):
-    @property
-    def _loop(self) -> asyncio.AbstractEventLoop:
-        return asyncio.get_event_loop()
+class AsyncScheduler(AbstractScheduler[asyncio.TimerHandle]):
+    def get_remaining(self, event: asyncio.TimerHandle) -> TimeoutValue:
+        return max(0, event.when() - asyncio.get_running_loop().time())
 
-    def get_remaining(self, event: Event) -> TimeoutValue:
-        return max(0, event.time - self._loop.time())
-
-    def new(self, seconds: TimeoutValue, handler: Callable[[], None]) -> AsyncEvent:
-        when = self._loop.time() + seconds
-        action = self._loop.call_at(when, handler)
-        args = {
-            "time": when,
-            "priority": 0,
-            "action": action.cancel,
-            "argument": (),
-            "kwargs": {},
-        }
-        if sys.version_info >= (3, 10):
-            args["sequence"] = 0
-        event = AsyncEvent(**args)  # type: ignore
-        return event
+    def new(self, seconds: TimeoutValue, handler: Callable[[], None]) -> asyncio.TimerHandle:
+        return asyncio.get_running_loop().call_later(seconds, handler)
 
-    def cancel(self, event: Union[Event, None]) -> None:
+    def cancel(self, event: Union[asyncio.TimerHandle, None]) -> None:
         if event is not None:
-            event.action()
+            event.cancel()
@@ -1,16 +1,18 @@
 import asyncio
-from functools import wraps
+from functools import partial, wraps
 from types import TracebackType
-from typing import Any, Optional, Type, Union, cast
+from typing import Any, Optional, Type, Union
 
 from ._errors import CancelledError
-from ._scheduler import AsyncEvent, AsyncScheduler, Event, Scheduler
+from ._scheduler import AsyncScheduler, Event, Scheduler
 from ._types import AnyCallable, ExceptionType, TimeoutValue
 
 __all__ = ("Timeout", "TimeoutProxy", "AsyncTimeoutProxy",)
 
 
 class TimeoutProxy:
+    __slots__ = ("_timeout",)
+
     def __init__(self, timeout: "Timeout") -> None:
         self._timeout = timeout
 
@@ -29,6 +31,8 @@ class TimeoutProxy:
 
 
 class AsyncTimeoutProxy(TimeoutProxy):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "AsyncTimeoutProxy(timeout({seconds}, exception={exception}))".format(
             seconds=self.remaining,
@@ -36,6 +40,9 @@ class AsyncTimeoutProxy(TimeoutProxy):
 
 
 class Timeout:
+    __slots__ = ("_scheduler", "_async_scheduler", "_seconds", "_enabled", "_exception",
+                 "_silent", "_event", "_async_event", "_raised", "_proxy", "_async_proxy",)
+
     def __init__(self,
                  scheduler: Scheduler,
                  async_scheduler: AsyncScheduler,
@@ -45,11 +52,14 @@ class Timeout:
         self._scheduler = scheduler
         self._async_scheduler = async_scheduler
         self._seconds = seconds
-        self._orig_exception = exception or CancelledError
-        self._exception = type("_CancelledError", (self._orig_exception,), {})
+        self._enabled = seconds > 0
+        self._exception = exception or CancelledError
         self._silent = exception is None
         self._event: Union[Event, None] = None
-        self._raised: Union[Event, None] = None
+        self._async_event: Union[asyncio.TimerHandle, None] = None
+        self._raised: Union[BaseException, None] = None
+        self._proxy: Union[TimeoutProxy, None] = None
+        self._async_proxy: Union[AsyncTimeoutProxy, None] = None
 
     @property
     def seconds(self) -> TimeoutValue:
@@ -57,75 +67,126 @@ class Timeout:
 
     @property
     def exception(self) -> Union[ExceptionType, None]:
-        return self._orig_exception if not self._silent else None
+        return self._exception if not self._silent else None
 
     @property
     def remaining(self) -> TimeoutValue:
-        if self._event is None:
-            return self._seconds
+        if self._async_event is not None:
+            return self._async_scheduler.get_remaining(self._async_event)
+        if self._event is not None:
+            return self._scheduler.get_remaining(self._event)
+        return self._seconds
 
-        if isinstance(self._event, AsyncEvent):
-            return self._async_scheduler.get_remaining(self._event)
-        return self._scheduler.get_remaining(self._event)
+    def _sync_handler(self) -> None:
+        self._scheduler.cancel(self._event)
+        self._raised = self._exception()
+        raise self._raised
 
-    def __enter__(self) -> TimeoutProxy:
-        def sync_handler() -> None:
-            self._scheduler.cancel(self._event)
+    def _async_handler(self, task: "Optional[asyncio.Task[Any]]") -> None:
+        if task is not None:
             self._raised = self._exception()
-            raise cast(BaseException, self._raised)
+            task.cancel()
 
-        if self._seconds > 0:
-            self._event = self._scheduler.new(self._seconds, sync_handler)
-        return TimeoutProxy(self)
+    def __enter__(self) -> TimeoutProxy:
+        self._raised = None
+        self._async_event = None
+        if self._enabled:
+            self._event = self._scheduler.new(self._seconds, self._sync_handler)
+        if self._proxy is None:
+            self._proxy = TimeoutProxy(self)
+        return self._proxy
 
     def __exit__(self,
                  exc_type: Optional[Type[BaseException]],
                  exc_val: Optional[BaseException],
                  exc_tb: Optional[TracebackType]) -> bool:
-        self._scheduler.cancel(self._event)
-        if isinstance(exc_val, self._exception):
+        if self._event is not None:
+            self._scheduler.cancel(self._event)
+        if (exc_val is not None) and (exc_val is self._raised):
             return self._silent
         return exc_val is None
 
     async def __aenter__(self) -> AsyncTimeoutProxy:
         task = asyncio.current_task()
-
-        def async_handler(task: "Optional[asyncio.Task[None]]" = task) -> None:
-            self._async_scheduler.cancel(self._event)
-            if task:
-                self._raised = self._exception()
-                task.cancel()
-
-        if self._seconds > 0:
-            self._event = self._async_scheduler.new(self._seconds, async_handler)
-        return AsyncTimeoutProxy(self)
+        self._raised = None
+        self._event = None
+        if self._enabled:
+            handler = partial(self._async_handler, task)
+            self._async_event = self._async_scheduler.new(self._seconds, handler)
+        if self._async_proxy is None:
+            self._async_proxy = AsyncTimeoutProxy(self)
+        return self._async_proxy
 
     async def __aexit__(self,
                         exc_type: Optional[Type[BaseException]],
                         exc_val: Optional[BaseException],
                         exc_tb: Optional[TracebackType]) -> bool:
-        self._async_scheduler.cancel(self._event)
+        if self._async_event is not None:
+            self._async_scheduler.cancel(self._async_event)
 
-        if isinstance(exc_val, asyncio.CancelledError) and \
-           isinstance(self._raised, self._exception):
+        if isinstance(exc_val, asyncio.CancelledError) and (self._raised is not None):
             if self._silent:
                 return True
-            raise cast(BaseException, self._raised)
+            raise self._raised
 
         return exc_val is None
 
     def __call__(self, fn: AnyCallable) -> AnyCallable:
+        if not self._enabled:
+            return fn
+
+        seconds = self._seconds
+        silent = self._silent
+        exception = self._exception
+
         if asyncio.iscoroutinefunction(fn):
+            async_scheduler = self._async_scheduler
+
             @wraps(fn)
             async def async_wrapped(*args: Any, **kwargs: Any) -> Any:
-                async with self:
+                task = asyncio.current_task()
+                raised: Optional[BaseException] = None
+
+                def async_handler() -> None:
+                    nonlocal raised
+                    if task is not None:
+                        raised = exception()
+                        task.cancel()
+
+                handle = async_scheduler.new(seconds, async_handler)
+                try:
                     return await fn(*args, **kwargs)
+                except asyncio.CancelledError:
+                    if raised is None:
+                        raise
+                    if silent:
+                        return None
+                    raise raised
+                finally:
+                    async_scheduler.cancel(handle)
             wrapped = async_wrapped
         else:
+            scheduler = self._scheduler
+
             @wraps(fn)
             def sync_wrapped(*args: Any, **kwargs: Any) -> Any:
-                with self:
+                raised: Optional[BaseException] = None
+
+                def sync_handler() -> None:
+                    nonlocal raised
+                    scheduler.cancel(event)
+                    raised = exception()
+                    raise raised
+
+                event = scheduler.new(seconds, sync_handler)
+                try:
                     return fn(*args, **kwargs)
+                except exception as e:
+                    if silent and (e is raised):
+                        return None
+                    raise
+                finally:
+                    scheduler.cancel(event)
             wrapped = sync_wrapped
         return wrapped
 
@@ -1,15 +1,16 @@
 from signal import Handlers
 from types import FrameType
-from typing import Any, Callable, Tuple, Type, Union
+from typing import Any, Awaitable, Callable, Tuple, Type, Union
 
 __all__ = ("AttemptValue", "TimeoutValue", "DelayValue", "DelayCallable",
-           "AnyCallable", "ExceptionType", "LoggerCallable", "UntilCallable",
+           "AsyncDelayCallable", "AnyCallable", "ExceptionType", "LoggerCallable", "UntilCallable",
            "SwallowException", "SignalHandler",)
 
 AttemptValue = int
 TimeoutValue = Union[float, int]
 DelayValue = Union[float, int]
 DelayCallable = Callable[[AttemptValue], DelayValue]
+AsyncDelayCallable = Callable[[AttemptValue], Awaitable[DelayValue]]
 AnyCallable = Callable[..., Any]
 ExceptionType = Type[BaseException]
 LoggerCallable = Callable[[AttemptValue, Any, AnyCallable], Any]
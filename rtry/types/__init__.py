@@ -3,6 +3,7 @@ from .._retry import Retry
 from .._scheduler import AbstractScheduler, AsyncEvent, AsyncScheduler, Event, Scheduler
 from .._timeout import AsyncTimeoutProxy, Timeout, TimeoutProxy
 from .._types import (
+    AsyncDelayCallable,
     AttemptValue,
     DelayCallable,
     DelayValue,
@@ -13,7 +14,7 @@ from .._types import (
     UntilCallable,
 )
 
-__all__ = ("AttemptValue", "TimeoutValue", "DelayValue", "DelayCallable",
+__all__ = ("AttemptValue", "TimeoutValue", "DelayValue", "DelayCallable", "AsyncDelayCallable",
            "ExceptionType", "LoggerCallable", "UntilCallable", "SwallowException",
            "Scheduler", "AsyncEvent", "Event", "Timeout", "TimeoutProxy", "AsyncTimeoutProxy",
            "Retry", "CancelledError", "AbstractScheduler", "AsyncScheduler",)
@@ -63,6 +63,13 @@ class TestAsyncRetry(TestCase):
             self.assertEqual(patched.await_args_list, [])
         self.assertEqual(mock.await_args_list, [call()])
 
+    async def test_default_delay_with_errors(self):
+        mock = AsyncMock(side_effect=(Exception, Exception, None))
+        with patch("asyncio.sleep", return_value=None) as patched:
+            await retry(attempts=3)(mock)()
+            self.assertEqual(patched.await_args_list, [])
+        self.assertEqual(mock.await_args_list, [call()] * 3)
+
     async def test_no_delay_without_errors(self):
         mock = AsyncMock(side_effect=None)
         with patch("asyncio.sleep", return_value=None) as patched:
@@ -101,9 +108,9 @@ class TestAsyncRetry(TestCase):
 
     async def test_delay_with_custom_backoff(self):
         mock = AsyncMock(side_effect=(Exception, Exception, None))
+        delay = Mock(side_effect=(42, 0))  # Coro
 
         with patch("asyncio.sleep", return_value=None) as patched:
-            delay = Mock(side_effect=(42, 0))  # Coro
             await retry(attempts=3, delay=delay)(mock)()
 
             self.assertEqual(delay.mock_calls, [call(1), call(2)])
@@ -111,6 +118,31 @@ class TestAsyncRetry(TestCase):
 
         self.assertEqual(mock.await_args_list, [call()] * 3)
 
+    async def test_delay_with_async_custom_backoff(self):
+        mock = AsyncMock(side_effect=(Exception, Exception, None))
+        delay = AsyncMock(side_effect=(42, 0))
+
+        with patch("asyncio.sleep", return_value=None) as patched:
+            await retry(attempts=3, delay=delay)(mock)()
+
+            self.assertEqual(delay.await_args_list, [call(1), call(2)])
+            self.assertEqual(patched.await_args_list, [call(42), call(0)])
+
+        self.assertEqual(mock.await_args_list, [call()] * 3)
+
+    async def test_backoff_with_errors(self):
+        mock = AsyncMock(side_effect=Exception)
+
+        with patch("asyncio.sleep", return_value=None) as patched:
+            with self.assertRaises(Exception):
+                await retry(attempts=5, backoff=(0.1, 0.5))(mock)()
+
+            self.assertEqual(patched.await_args_list, [
+                call(0.1), call(0.2), call(0.4), call(0.5), call(0.5)
+            ])
+
+        self.assertEqual(mock.await_args_list, [call()] * 5)
+
     # Swallow
 
     async def test_swallow_no_exceptions(self):
@@ -308,6 +340,14 @@ class TestAsyncRetry(TestCase):
 
     # Timeout
 
+    async def test_timeout_shared_between_functions(self):
+        decorator = retry(attempts=1, timeout=0.02)
+        fast = decorator(AsyncMock(return_value=sentinel.res))
+        slow = decorator(AsyncMock(side_effect=partial(asyncio.sleep, 0.05)))
+
+        with self.assertRaises(CancelledError):
+            await asyncio.gather(slow(), fast())
+
     async def test_timeout_without_delay(self):
         mock = AsyncMock()
         await retry(timeout=0.01)(mock)()
@@ -7,6 +7,10 @@ from unittest.mock import AsyncMock, Mock, call, sentinel
 from rtry import CancelledError, timeout
 
 
+class CustomException(CancelledError):
+    pass
+
+
 class TestAsyncTimeout(TestCase):
     async def test_wraps(self):
         async def fn():
@@ -72,7 +76,8 @@ class TestAsyncTimeout(TestCase):
     async def test_restores_prev_signal_handler_with_expected_delay(self):
         def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         @timeout(0.02)
         async def fn():
@@ -85,7 +90,8 @@ class TestAsyncTimeout(TestCase):
     async def test_restores_prev_signal_handler_with_unexpected_delay(self):
         async def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         @timeout(0.01)
         async def fn():
@@ -97,9 +103,6 @@ class TestAsyncTimeout(TestCase):
         self.assertEqual(handler_after, handler)
 
     async def test_custom_exception(self):
-        class CustomException(CancelledError):
-            pass
-
         @timeout(0.01, exception=CustomException)
         async def fn():
             await sleep(0.02)
@@ -238,6 +241,13 @@ class TestAsyncTimeout(TestCase):
         with self.assertRaises(CancelledError):
             await fn()
 
+    async def test_concurrent_calls(self):
+        @timeout(0.05)
+        async def fn(delay):
+            await sleep(delay)
+        with self.assertRaises(CancelledError):
+            await asyncio.gather(fn(0.2), fn(0.01))
+
     async def test_timeout_with_exception(self):
         @timeout(0.01)
         async def fn():
@@ -10,6 +10,10 @@ from rtry.types import AsyncTimeoutProxy
 from ._ignore_exception import ignore_exception
 
 
+class CustomException(CancelledError):
+    pass
+
+
 class TestAsyncTimeoutContext(TestCase):
     async def test_no_timeout(self):
         mock = Mock()
@@ -99,7 +103,8 @@ class TestAsyncTimeoutContext(TestCase):
     async def test_restores_prev_signal_handler_with_expected_delay(self):
         def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         async with timeout(0.02):
             await sleep(0.01)
@@ -110,7 +115,8 @@ class TestAsyncTimeoutContext(TestCase):
     async def test_restores_prev_signal_handler_with_unexpected_delay(self):
         def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         with self.assertRaises(CancelledError):
             async with timeout(0.01):
@@ -120,17 +126,11 @@ class TestAsyncTimeoutContext(TestCase):
         self.assertEqual(handler_after, handler)
 
     async def test_timeout_custom_exception_with_unexpected_delay(self):
-        class CustomException(CancelledError):
-            pass
-
         with self.assertRaises(CustomException):
             async with timeout(0.01, exception=CustomException):
                 await sleep(0.02)
 
     async def test_timeout_custom_exception_with_manual_raise(self):
-        class CustomException(CancelledError):
-            pass
-
         with self.assertRaises(CancelledError):
             async with timeout(0.01, exception=CustomException) as t:
                 raise t.exception()
@@ -308,6 +308,16 @@ class TestAsyncTimeoutContext(TestCase):
 
         self.assertEqual(mock.mock_calls, [call(1), call(2), call(3)])
 
+    async def test_timeout_shared_between_tasks(self):
+        t = timeout(0.05)
+
+        async def fn(delay):
+            async with t:
+                await sleep(delay)
+
+        with self.assertRaises(CancelledError):
+            await asyncio.gather(fn(0.2), fn(0.01))
+
     async def test_timeout_with_exception(self):
         with self.assertRaises(ZeroDivisionError):
             async with timeout(0.01):
@@ -1,7 +1,7 @@
 import unittest
 from functools import partial
 from time import sleep
-from unittest.mock import MagicMock, Mock, call, patch, sentinel
+from unittest.mock import Mock, call, patch, sentinel
 
 from rtry import CancelledError, retry
 
@@ -21,7 +21,7 @@ class TestRetry(unittest.TestCase):
         self.assertEqual(wrapped.__wrapped__, fn)
 
     def test_forwards_args_and_result(self):
-        mock = MagicMock(return_value=sentinel.res)
+        mock = Mock(return_value=sentinel.res)
 
         res = retry(attempts=1)(mock)(sentinel.a, sentinel.b, key1=sentinel.val, key2=None)
 
@@ -35,27 +35,27 @@ class TestRetry(unittest.TestCase):
             retry(attempts=0)
 
     def test_single_attempt(self):
-        mock = MagicMock(side_effect=None)
+        mock = Mock(side_effect=None)
         retry(attempts=1)(mock)()
         self.assertEqual(mock.call_count, 1)
 
     def test_multiple_attempts_without_errors(self):
-        mock = MagicMock(side_effect=None)
+        mock = Mock(side_effect=None)
         retry(attempts=3)(mock)()
         self.assertEqual(mock.call_count, 1)
 
     def test_multiple_attempts_with_error_after_start(self):
-        mock = MagicMock(side_effect=(Exception, None, None))
+        mock = Mock(side_effect=(Exception, None, None))
         retry(attempts=3)(mock)()
         self.assertEqual(mock.call_count, 2)
 
     def test_multiple_attempts_with_error_before_end(self):
-        mock = MagicMock(side_effect=(Exception, Exception, None))
+        mock = Mock(side_effect=(Exception, Exception, None))
         retry(attempts=3)(mock)()
         self.assertEqual(mock.call_count, 3)
 
     def test_multiple_attempts_with_errors(self):
-        mock = MagicMock(side_effect=Exception)
+        mock = Mock(side_effect=Exception)
         with self.assertRaises(Exception):
             retry(attempts=3)(mock)()
         self.assertEqual(mock.call_count, 3)
@@ -63,21 +63,35 @@ class TestRetry(unittest.TestCase):
     # Delay
 
     def test_default_delay(self):
-        mock = MagicMock(side_effect=None)
+        mock = Mock(side_effect=None)
         with patch("time.sleep", return_value=None) as patched:
             retry(attempts=3)(mock)()
             patched.assert_not_called()
         self.assertEqual(mock.call_count, 1)
 
+    def test_default_delay_with_errors(self):
+        mock = Mock(side_effect=(Exception, Exception, None))
+        with patch("time.sleep", return_value=None) as patched:
+            retry(attempts=3)(mock)()
+            patched.assert_not_called()
+        self.assertEqual(mock.call_count, 3)
+
+    def test_zero_delay_with_errors(self):
+        mock = Mock(side_effect=(Exception, Exception, None))
+        with patch("time.sleep", return_value=None) as patched:
+            retry(attempts=3, delay=0)(mock)()
+            patched.assert_not_called()
+        self.assertEqual(mock.call_count, 3)
+
     def test_no_delay_without_errors(self):
-        mock = MagicMock(side_effect=None)
+        mock = Mock(side_effect=None)
         with patch("time.sleep", return_value=None) as patched:
             retry(attempts=3, delay=1.0)(mock)()
             patched.assert_not_called()
         self.assertEqual(mock.call_count, 1)
 
     def test_delay_with_error_after_start(self):
-        mock = MagicMock(side_effect=(Exception, None, None))
+        mock = Mock(side_effect=(Exception, None, None))
         with patch("time.sleep", return_value=None) as patched:
             delay = 1.0
             retry(attempts=3, delay=delay)(mock)()
@@ -85,55 +99,74 @@ class TestRetry(unittest.TestCase):
         self.assertEqual(mock.call_count, 2)
 
     def test_delay_with_error_before_end(self):
-        mock = MagicMock(side_effect=(Exception, Exception, None))
+        mock = Mock(side_effect=(Exception, Exception, None))
 
         with patch("time.sleep", return_value=None) as patched:
             delay = 1.0
             retry(attempts=3, delay=delay)(mock)()
 
-            patched.assert_has_calls([call(delay)] * 2)
-            self.assertEqual(patched.call_count, 2)
+            self.assertEqual(patched.call_args_list, [call(delay)] * 2)
 
         self.assertEqual(mock.call_count, 3)
 
     def test_delay_with_errors(self):
-        mock = MagicMock(side_effect=Exception)
+        mock = Mock(side_effect=Exception)
 
         with patch("time.sleep", return_value=None) as patched:
             with self.assertRaises(Exception):
                 delay = 1.0
                 retry(attempts=3, delay=delay)(mock)()
 
-            patched.assert_has_calls([call(delay)] * 3)
-            self.assertEqual(patched.call_count, 3)
+            self.assertEqual(patched.call_args_list, [call(delay)] * 3)
 
         self.assertEqual(mock.call_count, 3)
 
     def test_delay_with_custom_backoff(self):
-        mock = MagicMock(side_effect=(Exception, Exception, None))
+        mock = Mock(side_effect=(Exception, Exception, None))
+        delay = Mock(side_effect=(42, 0))
 
         with patch("time.sleep", return_value=None) as patched:
-            delay = MagicMock(side_effect=(42, 0))
             retry(attempts=3, delay=delay)(mock)()
 
-            delay.assert_has_calls([call(1), call(2)])
-            self.assertEqual(delay.call_count, 2)
-
-            patched.assert_has_calls([call(42), call(0)])
-            self.assertEqual(patched.call_count, 2)
+            self.assertEqual(delay.call_args_list, [call(1), call(2)])
+            self.assertEqual(patched.call_args_list, [call(42), call(0)])
 
         self.assertEqual(mock.call_count, 3)
 
+    def test_delay_with_async_custom_backoff(self):
+        async def delay(attempt):
+            return 0
+
+        with self.assertRaises(AssertionError):
+            retry(attempts=3, delay=delay)(Mock())
+
+    def test_backoff_with_errors(self):
+        mock = Mock(side_effect=Exception)
+
+        with patch("time.sleep", return_value=None) as patched:
+            with self.assertRaises(Exception):
+                retry(attempts=5, backoff=(0.1, 0.5))(mock)()
+
+            self.assertEqual(patched.mock_calls, [
+                call(0.1), call(0.2), call(0.4), call(0.5), call(0.5)
+            ])
+
+        self.assertEqual(mock.call_count, 5)
+
+    def test_backoff_with_delay(self):
+        with self.assertRaises(AssertionError):
+            retry(attempts=3, delay=1.0, backoff=(0.1, 0.5))
+
     # Swallow
 
     def test_swallow_no_exceptions(self):
-        mock = MagicMock(side_effect=(Exception, None))
+        mock = Mock(side_effect=(Exception, None))
         with self.assertRaises(Exception):
             retry(attempts=2, swallow=None)(mock)()
         self.assertEqual(mock.call_count, 1)
 
     def test_swallow_builtin_exception(self):
-        mock = MagicMock(side_effect=(Exception, None))
+        mock = Mock(side_effect=(Exception, None))
         retry(attempts=3)(mock)()
         self.assertEqual(mock.call_count, 2)
 
@@ -141,41 +174,41 @@ class TestRetry(unittest.TestCase):
         class CustomException(Exception):
             pass
 
-        mock = MagicMock(side_effect=(CustomException, None))
+        mock = Mock(side_effect=(CustomException, None))
         retry(attempts=3)(mock)()
         self.assertEqual(mock.call_count, 2)
 
     def test_swallow_single_exception(self):
-        mock = MagicMock(side_effect=(KeyError, None))
+        mock = Mock(side_effect=(KeyError, None))
         retry(attempts=3, swallow=KeyError)(mock)()
         self.assertEqual(mock.call_count, 2)
 
-        mock = MagicMock(side_effect=(KeyError, IndexError, None))
+        mock = Mock(side_effect=(KeyError, IndexError, None))
         with self.assertRaises(IndexError):
             retry(attempts=3, swallow=KeyError)(mock)()
         self.assertEqual(mock.call_count, 2)
 
     def test_swallow_multiple_exceptions(self):
-        mock = MagicMock(side_effect=(KeyError, IndexError, None))
+        mock = Mock(side_effect=(KeyError, IndexError, None))
         retry(attempts=3, swallow=(KeyError, IndexError))(mock)()
         self.assertEqual(mock.call_count, 3)
 
-        mock = MagicMock(side_effect=(KeyError, IndexError, ZeroDivisionError))
+        mock = Mock(side_effect=(KeyError, IndexError, ZeroDivisionError))
         with self.assertRaises(ZeroDivisionError):
             retry(attempts=3, swallow=(KeyError, IndexError))(mock)()
         self.assertEqual(mock.call_count, 3)
 
     def test_swallow_list_exceptions(self):
-        mock = MagicMock(side_effect=(KeyError, None))
+        mock = Mock(side_effect=(KeyError, None))
         retry(attempts=3, swallow=[ValueError, KeyError])(mock)()
         self.assertEqual(mock.call_count, 2)
 
     # Until
 
     def test_until_without_errors(self):
-        until = MagicMock(side_effect=(False,))
+        until = Mock(side_effect=(False,))
 
-        mock = MagicMock(return_value=sentinel.res)
+        mock = Mock(return_value=sentinel.res)
         res = retry(until=until, attempts=3)(mock)()
 
         self.assertEqual(res, sentinel.res)
@@ -184,56 +217,53 @@ class TestRetry(unittest.TestCase):
         until.assert_called_once_with(sentinel.res)
 
     def test_until_with_error_after_start(self):
-        until = MagicMock(side_effect=(True, False))
+        until = Mock(side_effect=(True, False))
 
-        mock = MagicMock(side_effect=(sentinel.a, sentinel.b))
+        mock = Mock(side_effect=(sentinel.a, sentinel.b))
         res = retry(until=until, attempts=3)(mock)()
 
         self.assertEqual(res, sentinel.b)
         self.assertEqual(mock.call_count, 2)
 
-        until.assert_has_calls([
+        self.assertEqual(until.call_args_list, [
             call(sentinel.a),
             call(sentinel.b),
         ])
-        self.assertEqual(until.call_count, 2)
 
     def test_until_with_error_before_end(self):
-        until = MagicMock(side_effect=(True, True, False))
+        until = Mock(side_effect=(True, True, False))
 
-        mock = MagicMock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
+        mock = Mock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
         res = retry(until=until, attempts=3)(mock)()
 
         self.assertEqual(res, sentinel.c)
         self.assertEqual(mock.call_count, 3)
 
-        until.assert_has_calls([
+        self.assertEqual(until.call_args_list, [
             call(sentinel.a),
             call(sentinel.b),
             call(sentinel.c)
         ])
-        self.assertEqual(until.call_count, 3)
 
     def test_until_with_errors(self):
-        until = MagicMock(side_effect=(True, True, True))
+        until = Mock(side_effect=(True, True, True))
 
-        mock = MagicMock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
+        mock = Mock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
         retry(until=until, attempts=3)(mock)()
         self.assertEqual(mock.call_count, 3)
 
-        until.assert_has_calls([
+        self.assertEqual(until.call_args_list, [
             call(sentinel.a),
             call(sentinel.b),
             call(sentinel.c)
         ])
-        self.assertEqual(until.call_count, 3)
 
     # Logger
 
     def test_custom_logger_without_errors(self):
         logger = Mock()
 
-        mock = MagicMock()
+        mock = Mock()
         retry(attempts=3, logger=logger)(mock)()
 
         logger.assert_not_called()
@@ -242,7 +272,7 @@ class TestRetry(unittest.TestCase):
         logger = Mock()
 
         exception = Exception()
-        mock = MagicMock(side_effect=(exception, None))
+        mock = Mock(side_effect=(exception, None))
         retry(attempts=3, logger=logger)(mock)()
 
         logger.assert_called_once_with(1, exception, mock)
@@ -251,36 +281,39 @@ class TestRetry(unittest.TestCase):
         logger = Mock()
 
         exception1, exception2 = Exception(), Exception()
-        mock = MagicMock(side_effect=(exception1, exception2, None))
+        mock = Mock(side_effect=(exception1, exception2, None))
         retry(attempts=3, logger=logger)(mock)()
 
-        logger.assert_has_calls([
+        self.assertEqual(logger.call_args_list, [
             call(1, exception1, mock),
             call(2, exception2, mock)
         ])
-        self.assertEqual(logger.call_count, 2)
 
     def test_logger_with_errors(self):
         logger = Mock()
 
         exception = Exception()
-        mock = MagicMock(side_effect=exception)
+        mock = Mock(side_effect=exception)
         with self.assertRaises(type(exception)):
             retry(attempts=3, logger=logger)(mock)()
 
-        logger.assert_has_calls([
+        self.assertEqual(logger.call_args_list, [
             call(1, exception, mock),
             call(2, exception, mock),
             call(3, exception, mock)
         ])
-        self.assertEqual(logger.call_count, 3)
+
+    def test_non_callable_logger_with_errors(self):
+        mock = Mock(side_effect=(Exception, None))
+        retry(attempts=3, logger=sentinel.logger)(mock)()
+        self.assertEqual(mock.call_count, 2)
 
     # Logger with Until
 
     def test_logger_with_until_true_after_start(self):
         logger = Mock()
-        until = MagicMock(side_effect=(True, False, False))
-        mock = MagicMock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
+        until = Mock(side_effect=(True, False, False))
+        mock = Mock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
 
         res = retry(until=until, attempts=3, logger=logger)(mock)()
         self.assertEqual(mock.call_count, 2)
@@ -290,34 +323,32 @@ class TestRetry(unittest.TestCase):
 
     def test_logger_with_until_true_before_end(self):
         logger = Mock()
-        until = MagicMock(side_effect=(True, True, False))
-        mock = MagicMock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
+        until = Mock(side_effect=(True, True, False))
+        mock = Mock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
 
         res = retry(until=until, attempts=3, logger=logger)(mock)()
         self.assertEqual(mock.call_count, 3)
         self.assertEqual(res, sentinel.c)
 
-        logger.assert_has_calls([
+        self.assertEqual(logger.call_args_list, [
             call(1, sentinel.a, mock),
             call(2, sentinel.b, mock)
         ])
-        self.assertEqual(logger.call_count, 2)
 
     def test_logger_with_until_true(self):
         logger = Mock()
-        until = MagicMock(side_effect=(True, True, True))
-        mock = MagicMock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
+        until = Mock(side_effect=(True, True, True))
+        mock = Mock(side_effect=(sentinel.a, sentinel.b, sentinel.c))
 
         res = retry(until=until, attempts=3, logger=logger)(mock)()
         self.assertEqual(mock.call_count, 3)
         self.assertEqual(res, sentinel.c)
 
-        logger.assert_has_calls([
+        self.assertEqual(logger.call_args_list, [
             call(1, sentinel.a, mock),
             call(2, sentinel.b, mock),
             call(3, sentinel.c, mock)
         ])
-        self.assertEqual(logger.call_count, 3)
 
     # Timeout
 
@@ -325,20 +356,36 @@ class TestRetry(unittest.TestCase):
         with self.assertRaises(AssertionError):
             retry(timeout=-1)
 
+    def test_zero_timeout(self):
+        mock = Mock(side_effect=(Exception, sentinel.res))
+        with patch("signal.setitimer") as patched:
+            res = retry(attempts=3, timeout=0)(mock)()
+            patched.assert_not_called()
+        self.assertEqual(res, sentinel.res)
+        self.assertEqual(mock.call_count, 2)
+
+    def test_timeout_shared_between_functions(self):
+        decorator = retry(attempts=1, timeout=0.02)
+        inner = decorator(Mock(return_value=sentinel.res))
+        outer = decorator(Mock(side_effect=lambda: inner()))
+
+        self.assertEqual(outer(), sentinel.res)
+        sleep(0.04)
+
     def test_timeout_without_delay(self):
-        mock = MagicMock()
+        mock = Mock()
         retry(timeout=0.01)(mock)()
         self.assertEqual(mock.call_count, 1)
 
     def test_timeout_with_expected_delay(self):
-        mock = MagicMock(side_effect=partial(sleep, 0.01))
+        mock = Mock(side_effect=partial(sleep, 0.01))
 
         retry(timeout=0.03)(mock)()
 
         self.assertEqual(mock.call_count, 1)
 
     def test_timeout_with_unexpected_delay(self):
-        mock = MagicMock(side_effect=partial(sleep, 0.03))
+        mock = Mock(side_effect=partial(sleep, 0.03))
 
         with self.assertRaises(CancelledError):
             retry(timeout=0.01)(mock)()
@@ -346,7 +393,7 @@ class TestRetry(unittest.TestCase):
         self.assertEqual(mock.call_count, 1)
 
     def test_timeout_with_errors(self):
-        mock = MagicMock(side_effect=Exception)
+        mock = Mock(side_effect=Exception)
 
         with self.assertRaises(CancelledError):
             retry(timeout=0.01)(mock)()
@@ -354,7 +401,7 @@ class TestRetry(unittest.TestCase):
         self.assertGreater(mock.call_count, 1)
 
     def test_timeout_with_error_after_start(self):
-        mock = MagicMock(side_effect=(Exception, sentinel.res, sentinel.res, sentinel.res))
+        mock = Mock(side_effect=(Exception, sentinel.res, sentinel.res, sentinel.res))
 
         res = retry(timeout=0.01)(mock)()
 
@@ -362,7 +409,7 @@ class TestRetry(unittest.TestCase):
         self.assertEqual(res, sentinel.res)
 
     def test_timeout_with_error_before_end(self):
-        mock = MagicMock(side_effect=(Exception, Exception, sentinel.res, sentinel.res))
+        mock = Mock(side_effect=(Exception, Exception, sentinel.res, sentinel.res))
 
         res = retry(timeout=0.01)(mock)()
 
@@ -370,7 +417,7 @@ class TestRetry(unittest.TestCase):
         self.assertEqual(res, sentinel.res)
 
     def test_do_not_swallow_timeout_error(self):
-        mock = MagicMock(side_effect=Exception)
+        mock = Mock(side_effect=Exception)
         with self.assertRaises(CancelledError):
             retry(timeout=0.01, swallow=(Exception, CancelledError))(mock)()
         self.assertGreater(mock.call_count, 1)
@@ -378,7 +425,7 @@ class TestRetry(unittest.TestCase):
     # Timeout with Attempts
 
     def test_timeout_with_exceeded_attempts(self):
-        mock = MagicMock(side_effect=ZeroDivisionError)
+        mock = Mock(side_effect=ZeroDivisionError)
 
         with self.assertRaises(ZeroDivisionError):
             retry(attempts=3, timeout=1.0)(mock)()
@@ -389,7 +436,7 @@ class TestRetry(unittest.TestCase):
         def side_effect():
             sleep(0.01)
             raise ZeroDivisionError()
-        mock = MagicMock(side_effect=side_effect)
+        mock = Mock(side_effect=side_effect)
 
         with self.assertRaises(CancelledError):
             retry(attempts=99, timeout=0.03)(mock)()
@@ -424,6 +471,11 @@ class TestRetry(unittest.TestCase):
             repr(retry(attempts=3, delay=exp)),
             "retry(attempts=3, delay={})".format(repr(exp)))
 
+    def test_repr_with_backoff(self):
+        self.assertEqual(
+            repr(retry(attempts=3, backoff=(0.1, 1.0))),
+            "retry(attempts=3, backoff=(0.1, 1.0))")
+
     def test_repr_with_no_swallow(self):
         self.assertEqual(
             repr(retry(attempts=3, swallow=None)),
@@ -6,6 +6,10 @@ from unittest.mock import Mock, call, sentinel
 from rtry import CancelledError, timeout
 
 
+class CustomException(CancelledError):
+    pass
+
+
 class TestTimeout(unittest.TestCase):
     def test_wraps(self):
         def fn():
@@ -20,6 +24,11 @@ class TestTimeout(unittest.TestCase):
             pass
         fn()
 
+    def test_no_timeout_returns_fn(self):
+        def fn():
+            pass
+        self.assertIs(timeout(0)(fn), fn)
+
     def test_timeout_without_delay(self):
         @timeout(0.01)
         def fn():
@@ -75,8 +84,6 @@ class TestTimeout(unittest.TestCase):
         self.assertEqual(exception, CancelledError)
 
     def test_timeout_exception_property_custom(self):
-        class CustomException(CancelledError):
-            pass
         exception = timeout(0.05, exception=CustomException).exception
         self.assertEqual(exception, CustomException)
 
@@ -87,7 +94,8 @@ class TestTimeout(unittest.TestCase):
     def test_restores_prev_signal_handler_with_expected_delay(self):
         def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         @timeout(0.02)
         def fn():
@@ -100,7 +108,8 @@ class TestTimeout(unittest.TestCase):
     def test_restores_prev_signal_handler_with_unexpected_delay(self):
         def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         @timeout(0.01)
         def fn():
@@ -112,9 +121,6 @@ class TestTimeout(unittest.TestCase):
         self.assertEqual(handler_after, handler)
 
     def test_custom_exception(self):
-        class CustomException(CancelledError):
-            pass
-
         @timeout(0.01, exception=CustomException)
         def fn():
             sleep(0.02)
@@ -149,8 +155,7 @@ class TestTimeout(unittest.TestCase):
 
         with self.assertRaises(CancelledError):
             outer()
-        mock.assert_has_calls([call(1), call(2)])
-        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(mock.mock_calls, [call(1), call(2)])
 
     def test_nested_timeout_outer_propagation(self):
         mock = Mock()
@@ -169,8 +174,7 @@ class TestTimeout(unittest.TestCase):
 
         with self.assertRaises(CancelledError):
             outer()
-        mock.assert_has_calls([call(1), call(2)])
-        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(mock.mock_calls, [call(1), call(2)])
 
     def test_nested_timeout_outer_raises(self):
         mock = Mock()
@@ -191,8 +195,7 @@ class TestTimeout(unittest.TestCase):
 
         with self.assertRaises(CancelledError):
             outer()
-        mock.assert_has_calls([call(1), call(2), call(3), call(4)])
-        self.assertEqual(mock.call_count, 4)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3), call(4)])
 
     def test_nested_timeout_outer_raises_inner_silent(self):
         mock = Mock()
@@ -213,8 +216,7 @@ class TestTimeout(unittest.TestCase):
 
         with self.assertRaises(CancelledError):
             outer()
-        mock.assert_has_calls([call(1), call(2), call(4)])
-        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(4)])
 
     def test_nested_timeout_raises_with_same_timeout(self):
         mock = Mock()
@@ -233,8 +235,7 @@ class TestTimeout(unittest.TestCase):
 
         with self.assertRaises(CancelledError):
             outer()
-        mock.assert_has_calls([call(1), call(2)])
-        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(mock.mock_calls, [call(1), call(2)])
 
     def test_multiple_calls_with_expected_delay(self):
         @timeout(0.01)
@@ -253,6 +254,15 @@ class TestTimeout(unittest.TestCase):
         with self.assertRaises(CancelledError):
             fn()
 
+    def test_recursive_call(self):
+        @timeout(0.02)
+        def fn(depth):
+            if depth:
+                return fn(depth - 1)
+            return sentinel.res
+        self.assertEqual(fn(1), sentinel.res)
+        sleep(0.04)
+
     def test_timeout_with_exception(self):
         @timeout(0.01)
         def fn():
@@ -292,8 +302,6 @@ class TestTimeout(unittest.TestCase):
             "timeout(1.0, exception=None)")
 
     def test_timeout_repr_with_custom_exception(self):
-        class CustomException(CancelledError):
-            pass
         self.assertEqual(
             repr(timeout(1.0, exception=CustomException)),
             "timeout(1.0, exception={})".format(repr(CustomException)))
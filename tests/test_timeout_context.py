@@ -9,6 +9,10 @@ from rtry.types import TimeoutProxy
 from ._ignore_exception import ignore_exception
 
 
+class CustomException(CancelledError):
+    pass
+
+
 class TestTimeoutContext(unittest.TestCase):
     def test_no_timeout(self):
         mock = Mock()
@@ -28,8 +32,7 @@ class TestTimeoutContext(unittest.TestCase):
             mock(1)
             sleep(0.01)
             mock(2)
-        mock.assert_has_calls([call(1), call(2)])
-        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(mock.mock_calls, [call(1), call(2)])
 
     def test_timeout_with_unexpected_delay(self):
         mock = Mock()
@@ -40,6 +43,12 @@ class TestTimeoutContext(unittest.TestCase):
                 mock(2)
         mock.assert_called_once_with(1)
 
+    def test_timeout_raises_exception_class(self):
+        with self.assertRaises(CancelledError) as ctx:
+            with timeout(0.01):
+                sleep(0.02)
+        self.assertIs(type(ctx.exception), CancelledError)
+
     def test_timeout_with_ignored_inner_exception(self):
         mock = Mock()
         with self.assertRaises(CancelledError):
@@ -99,7 +108,8 @@ class TestTimeoutContext(unittest.TestCase):
     def test_restores_prev_signal_handler_with_expected_delay(self):
         def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         with timeout(0.02):
             sleep(0.01)
@@ -110,7 +120,8 @@ class TestTimeoutContext(unittest.TestCase):
     def test_restores_prev_signal_handler_with_unexpected_delay(self):
         def handler():
             pass
-        signal.signal(signal.SIGALRM, handler)
+        prev_handler = signal.signal(signal.SIGALRM, handler)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
         with self.assertRaises(CancelledError):
             with timeout(0.01):
@@ -119,18 +130,25 @@ class TestTimeoutContext(unittest.TestCase):
         handler_after = signal.getsignal(signal.SIGALRM)
         self.assertEqual(handler_after, handler)
 
-    def test_timeout_custom_exception_with_unexpected_delay(self):
-        class CustomException(CancelledError):
-            pass
+    def test_reinstalls_handler_replaced_inside_timeout(self):
+        handler = Mock()
+        prev_handler = signal.getsignal(signal.SIGALRM)
+        self.addCleanup(signal.signal, signal.SIGALRM, prev_handler)
 
+        with timeout(1.0):
+            signal.signal(signal.SIGALRM, handler)
+            with self.assertRaises(CancelledError):
+                with timeout(0.01):
+                    sleep(0.02)
+
+        handler.assert_not_called()
+
+    def test_timeout_custom_exception_with_unexpected_delay(self):
         with self.assertRaises(CustomException):
             with timeout(0.01, exception=CustomException):
                 sleep(0.02)
 
     def test_timeout_custom_exception_with_manual_raise(self):
-        class CustomException(CancelledError):
-            pass
-
         with self.assertRaises(CustomException):
             with timeout(0.01, exception=CustomException) as t:
                 raise t.exception()
@@ -147,8 +165,7 @@ class TestTimeoutContext(unittest.TestCase):
                     mock(3)
                 mock(4)
 
-        mock.assert_has_calls([call(1), call(2)])
-        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(mock.mock_calls, [call(1), call(2)])
 
     def test_nested_timeout_outer_propagation(self):
         mock = Mock()
@@ -162,8 +179,7 @@ class TestTimeoutContext(unittest.TestCase):
                     mock(3)
                 mock(4)
 
-        mock.assert_has_calls([call(1), call(2)])
-        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(mock.mock_calls, [call(1), call(2)])
 
     def test_nested_timeout_outer_raises(self):
         mock = Mock()
@@ -179,8 +195,7 @@ class TestTimeoutContext(unittest.TestCase):
                 sleep(0.04)
                 mock(5)
 
-        mock.assert_has_calls([call(1), call(2), call(3), call(4)])
-        self.assertEqual(mock.call_count, 4)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3), call(4)])
 
     def test_nested_timeout_outer_raises_inner_silent(self):
         mock = Mock()
@@ -196,8 +211,7 @@ class TestTimeoutContext(unittest.TestCase):
                 sleep(0.05)
                 mock(5)
 
-        mock.assert_has_calls([call(1), call(2), call(4)])
-        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(4)])
 
     def test_nested_timeout_raises_with_same_timeout(self):
         mock = Mock()
@@ -211,8 +225,7 @@ class TestTimeoutContext(unittest.TestCase):
                     mock(3)
                 mock(4)
 
-        mock.assert_has_calls([call(1), call(2)])
-        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(mock.mock_calls, [call(1), call(2)])
 
     def test_multiple_nested_timeout_inner_propagation(self):
         mock = Mock()
@@ -229,8 +242,7 @@ class TestTimeoutContext(unittest.TestCase):
                     mock(5)
                 mock(6)
 
-        mock.assert_has_calls([call(1), call(2), call(3)])
-        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3)])
 
     def test_multiple_nested_silent_timeout_inner_propagation(self):
         mock = Mock()
@@ -246,8 +258,7 @@ class TestTimeoutContext(unittest.TestCase):
                 mock(5)
             mock(6)
 
-        mock.assert_has_calls([call(1), call(2), call(3), call(5), call(6)])
-        self.assertEqual(mock.call_count, 5)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3), call(5), call(6)])
 
     def test_multiple_nested_timeout_propagation(self):
         mock = Mock()
@@ -264,8 +275,7 @@ class TestTimeoutContext(unittest.TestCase):
                     mock(5)
                 mock(6)
 
-        mock.assert_has_calls([call(1), call(2), call(3)])
-        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3)])
 
     def test_multiple_nested_silent_timeout_propagation(self):
         mock = Mock()
@@ -281,8 +291,7 @@ class TestTimeoutContext(unittest.TestCase):
                 mock(5)
             mock(6)
 
-        mock.assert_has_calls([call(1), call(2), call(3), call(6)])
-        self.assertEqual(mock.call_count, 4)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3), call(6)])
 
     def test_multiple_nested_timeout_outer_propagation(self):
         mock = Mock()
@@ -299,8 +308,7 @@ class TestTimeoutContext(unittest.TestCase):
                     mock(5)
                 mock(6)
 
-        mock.assert_has_calls([call(1), call(2), call(3)])
-        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3)])
 
     def test_multiple_nested_silent_timeout_outer_propagation(self):
         mock = Mock()
@@ -316,8 +324,7 @@ class TestTimeoutContext(unittest.TestCase):
                 mock(5)
             mock(6)
 
-        mock.assert_has_calls([call(1), call(2), call(3)])
-        self.assertEqual(mock.call_count, 3)
+        self.assertEqual(mock.mock_calls, [call(1), call(2), call(3)])
 
     def test_timeout_with_exception(self):
         with self.assertRaises(ZeroDivisionError):